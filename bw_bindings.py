@@ -1,12 +1,41 @@
+import asyncio
+import atexit
+import base64
+import ctypes
+import hashlib
+import http.client
 import json
 import os
+import re
 import shutil
+import sqlite3
+import signal
+import socket
 import subprocess
-from functools import wraps
-from typing import Any, Dict, Literal, Optional, Union
+import threading
+import time
+import urllib.parse
+import warnings
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Literal, Optional, Union
 
 from pynentry import PynEntry
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional, stdlib json works fine
+    _loads = json.loads
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # cryptography is only needed for the on-disk cache
+    Fernet = None
+
+try:
+    import ijson
+except ImportError:  # ijson is only needed to stream `iter_list` replies
+    ijson = None
+
 
 # generic bitwarden bindings error
 class BitwardenError(Exception):
@@ -52,21 +81,96 @@ BWTemplates = Literal[
 ]
 
 
-def _logged_in(method):
-    "decorator for class methods to ensure that session is logged in"
+# login/logout stderr is scanned once with compiled alternations instead of
+# several substring passes over a buffer full of ANSI escapes
+_LOGIN_ERR_RE = re.compile(r"API key client_secret|Username or password is incorrect")
+_NOT_LOGGED_IN_RE = re.compile(rb"not logged in")
+
+
+# `get` objects whose replies are json documents; everything else comes back
+# as a plain string (passwords, totp codes, fingerprints...)
+_JSON_OBJS = frozenset(
+    {"item", "folder", "collection", "organization", "org_collection", "template"}
+)
+
+
+# precomputed CLI spellings for the common `list` kwargs
+_LIST_FLAG_NAMES = {
+    key: f"--{key}"
+    for key in ("search", "trash", "folderid", "collectionid", "organizationid", "url")
+}
+
+
+# None of the Popen calls below use preexec_fn, pass_fds, or cwd, so CPython
+# can launch `bw` through its fast vfork/posix_spawn path, which skips
+# duplicating the parent's page tables; keep it that way. Warn once if this
+# interpreter cannot use that path at all.
+if not getattr(subprocess, "_USE_POSIX_SPAWN", True):
+    warnings.warn(
+        "subprocess will fall back to fork+exec on this interpreter; "
+        "spawning `bw` from a large process will be slower",
+        RuntimeWarning,
+    )
+
+
+def _cache_path() -> str:
+    "Location of the on-disk `get` cache."
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "bw_bindings", "cache.db")
+
+
+@lru_cache(maxsize=1)
+def _find_bw() -> Optional[str]:
+    "Locate the `bw` CLI on $PATH, walking it only once per process."
+    return shutil.which("bw")
+
+
+def _communicate(proc, stdin=None, timeout=None):
+    """`Popen.communicate` with an escalating kill if the CLI wedges.
+
+    A hung `bw` (or a filled pipe) can keep `communicate` from returning
+    even with a timeout; on expiry the child is killed, and if it still
+    refuses to die it gets a SIGKILL before the buffers are drained."""
+
+    try:
+        return proc.communicate(stdin, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        try:
+            return proc.communicate(timeout=1)
+        except subprocess.TimeoutExpired:
+            os.kill(proc.pid, signal.SIGKILL)
+            return proc.communicate()
+
+
+def _zero(buf: bytearray):
+    "Overwrite a sensitive buffer in place before letting it go."
+    ctypes.memset((ctypes.c_char * len(buf)).from_buffer(buf), 0, len(buf))
+
+
+def _free_port() -> int:
+    "Ask the OS for an unused localhost port for `bw serve` to bind."
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
 
-    @wraps(method)
-    def wrapper(self, *args, **kwargs):
-        if self.key is None:
-            raise BitwardenNotLoggedInError(
-                (
-                    f"Bitwarden cannot execute {method.__name__} "
-                    "because session is not currently logged in."
-                )
-            )
-        return method(self, *args, **kwargs)
 
-    return wrapper
+# `bw serve` daemons shared across Session instances, keyed by username:
+# username -> [proc, port, refcount]. Guarded by _daemons_lock.
+_daemons: Dict[str, list] = {}
+_daemons_lock = threading.Lock()
+
+
+def _kill_leaked_daemons():
+    "Terminate any `bw serve` daemons still alive at interpreter shutdown."
+    with _daemons_lock:
+        procs = [entry[0] for entry in _daemons.values()]
+        _daemons.clear()
+    for proc in procs:
+        proc.terminate()
+
+
+atexit.register(_kill_leaked_daemons)
 
 
 class Session:
@@ -78,35 +182,111 @@ class Session:
         passwd: Optional[str] = None,
         executable: Optional[os.PathLike] = None,
         timeout=40,
+        serve: bool = False,
+        cache_ttl: float = 0,
     ):
         self.key = None
         self.username = username
-        self.passwd = passwd
+        # held as a mutable buffer so login() can zero it after use
+        self.passwd = bytearray(passwd.encode("utf8")) if passwd is not None else None
+        self.serve = serve
+        self._serve_proc: Optional[subprocess.Popen] = None
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._get_cache: Dict[tuple, Any] = {}
+        self._child_env: Optional[Dict[str, str]] = None
+        self.cache_ttl = cache_ttl
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._fernet = None
+        if cache_ttl and Fernet is None:
+            raise BitwardenError(
+                "The on-disk cache requires the `cryptography` package."
+            )
         if executable is None:
-            _exe = shutil.which("bw")
+            _exe = _find_bw()
         else:
             _exe = executable
         if not _exe:
             raise BitwardenError("Bitwarden CLI executable `bw` could not be found.")
         self.executable = str(_exe)
         self.timeout = timeout
+        self._guard_methods()
+
+    # methods that are only valid while logged in; __init__ and logout shadow
+    # them on the instance with _not_logged_in and login removes the shadows,
+    # so the logged-in hot path pays no per-call check at all
+    _GUARDED = ("get", "get_item", "get_template", "get_items", "list", "iter_list")
+
+    def _not_logged_in(self, *args, **kwargs):
+        raise BitwardenNotLoggedInError(
+            (
+                "Bitwarden cannot execute vault calls "
+                "because session is not currently logged in."
+            )
+        )
+
+    def _guard_methods(self):
+        for name in self._GUARDED:
+            setattr(self, name, self._not_logged_in)
+
+    def _unguard_methods(self):
+        for name in self._GUARDED:
+            self.__dict__.pop(name, None)
+
+    def _obtain_passwd(self, passwd: Optional[str]) -> bytearray:
+        "Fall back to the stored password, then a Pinentry prompt."
+
+        if passwd is not None:
+            return bytearray(passwd.encode("utf8"))
+        if self.passwd is not None:
+            return bytearray(self.passwd)
+        with PynEntry() as p:
+            p.description = "Enter your Bitwarden Password"
+            p.prompt = ">"
+            pw = bytearray(p.get_pin().encode("utf8"))  # type: ignore
+        pw.append(0x0A)  # the newline a terminal prompt would have sent
+        return pw
+
+    def _finish_login(self, session_key: bytes, err: bytes, returncode) -> str:
+        "Check a login reply for errors and store the session key."
+
+        err = err.decode("utf8")
+
+        match = _LOGIN_ERR_RE.search(err)
+        if match is not None:
+            if match.group(0) == "API key client_secret":
+                raise BitwardenError(
+                    (
+                        "CLI must be authenticated with API key: "
+                        "https://bitwarden.com/help/article/cli-auth-challenges/"
+                    )
+                )
+            raise BitwardenPasswordError(
+                f'Password for "{self.username}" is incorrect. Try Again.'
+            )
+        if not session_key or returncode != 0:
+            raise BitwardenError(f"Problem logging in: {err}")
+
+        key = session_key.decode("utf8")
+        self.key = key
+        self.refresh_env()
+        self._unguard_methods()
+        return key
+
+    def refresh_env(self):
+        """Rebuild the cached environment passed to `bw` calls. Only needed
+        after mutating `os.environ` in the middle of a session."""
+
+        self._child_env = {**os.environ, "BW_SESSION": str(self.key)}
 
     def login(self, passwd: Optional[str] = None) -> str:
         """Log into bitwarden and save the session key for use.
         If no password has been supplied, prompt user with Pinentry"""
 
-        if passwd is None:
-            passwd = self.passwd
-        if passwd is None:
-            with PynEntry() as p:
-                p.description = "Enter your Bitwarden Password"
-                p.prompt = ">"
-                passwd = p.get_pin() + "\n"  # type: ignore
+        passwd = self._obtain_passwd(passwd)
 
-        args = f"login {self.username} --raw".split()
         try:
             bw = subprocess.Popen(
-                [self.executable] + args,
+                [self.executable, "login", self.username, "--raw"],
                 stdin=-1,
                 stdout=-1,
                 stderr=-1,
@@ -116,87 +296,301 @@ class Session:
                 f"Bitwarden CLI `{self.executable}` could not be found."
             ) from e
 
-        session_key, err = bw.communicate(passwd.encode("utf8"), timeout=self.timeout)  # type: ignore
+        session_key, err = _communicate(bw, bytes(passwd), timeout=self.timeout)
+        _zero(passwd)
         del passwd  # Don't let sensitive info hang around
-        err = err.decode("utf8")
-
-        if "API key client_secret" in err:
-            raise BitwardenError(
-                (
-                    "CLI must be authenticated with API key: "
-                    "https://bitwarden.com/help/article/cli-auth-challenges/"
+        key = self._finish_login(session_key, err, bw.returncode)
+        if self.serve:
+            self._start_serve()
+        return key
+
+    def _start_serve(self):
+        """Attach to (or launch) the `bw serve` REST backend for this user.
+
+        The backend keeps the vault decrypted in one long-lived process so
+        repeated `get`/`list` calls skip the Node startup cost of forking
+        the CLI. Daemons are shared across Session instances with the same
+        username and refcounted, so that cost is paid once per process."""
+
+        with _daemons_lock:
+            entry = _daemons.get(self.username)
+            if entry is not None:
+                entry[2] += 1
+                self._serve_proc, port = entry[0], entry[1]
+            else:
+                port = _free_port()
+                self._serve_proc = subprocess.Popen(
+                    [
+                        self.executable,
+                        "serve",
+                        "--port",
+                        str(port),
+                        "--hostname",
+                        "127.0.0.1",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=self._child_env,
                 )
-            )
-        if "Username or password is incorrect" in err:
-            raise BitwardenPasswordError(
-                'Password for "{username}" is incorrect. Try Again.'
-            )
-        if not session_key or bw.returncode != 0:
-            raise BitwardenError(f"Problem logging in: {err}")
-
-        session_key = session_key.decode("utf8")
-        self.key = session_key
-        return session_key
+                _daemons[self.username] = [self._serve_proc, port, 1]
+        self._conn = http.client.HTTPConnection("127.0.0.1", port, timeout=self.timeout)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._conn.request("GET", "/status")
+                self._conn.getresponse().read()
+                break
+            except OSError:
+                self._conn.close()
+                if self._serve_proc.poll() is not None or time.monotonic() > deadline:
+                    self._stop_serve()
+                    raise BitwardenError("`bw serve` backend failed to start.")
+                time.sleep(0.1)
+
+    def _stop_serve(self):
+        """Detach from the shared `bw serve` backend; the last session to
+        detach locks the vault and tears the daemon down."""
+
+        proc = None
+        with _daemons_lock:
+            entry = _daemons.get(self.username)
+            if entry is not None:
+                entry[2] -= 1
+                if entry[2] <= 0:
+                    del _daemons[self.username]
+                    proc = entry[0]
+        if self._conn is not None:
+            if proc is not None:  # last user out locks the vault
+                try:
+                    self._conn.request("POST", "/lock")
+                    self._conn.getresponse().read()
+                except OSError:
+                    pass
+            self._conn.close()
+            self._conn = None
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        self._serve_proc = None
 
     def logout(self):
         "Logout of BitWarden session and delete the session key"
 
+        if self.serve:
+            self._stop_serve()
         bw = subprocess.Popen(
-            [self.executable] + f"logout --session {self.key}".split(),
+            [self.executable, "logout"],
             stdout=-1,
             stderr=-1,
+            env=self._child_env,
         )
-        _, err = bw.communicate(timeout=self.timeout)
-        if b"not logged in" in err:
+        _, err = _communicate(bw, timeout=self.timeout)
+        self._finish_logout(err, bw.returncode)
+
+    def _finish_logout(self, err: bytes, returncode):
+        "Check a logout reply for errors and forget the session key."
+
+        self._get_cache.clear()
+        self._child_env = None
+        self._fernet = None
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+        if _NOT_LOGGED_IN_RE.search(err):
             self.key = None
+            self._guard_methods()
             return
-        if bw.returncode != 0:
+        if returncode != 0:
             raise BitwardenError("Problem with logging out of session.")
         self.key = None
+        self._guard_methods()
+
+    def invalidate(self, obj: Optional[str] = None, ident: Optional[str] = None):
+        """Drop cached `get` replies, e.g. after editing the vault.
+        With no arguments the whole cache is cleared; otherwise only
+        entries matching the given obj and/or ident are dropped. The
+        on-disk cache (if enabled) is pruned the same way."""
+
+        if obj is None and ident is None:
+            self._get_cache.clear()
+        else:
+            stale = [
+                key
+                for key in self._get_cache
+                if (obj is None or key[0] == obj)
+                and (ident is None or key[1] == ident)
+            ]
+            for key in stale:
+                del self._get_cache[key]
+        if self.cache_ttl:
+            conditions, params = [], []
+            if obj is not None:
+                conditions.append("obj = ?")
+                params.append(obj)
+            if ident is not None:
+                conditions.append("ident = ?")
+                params.append(ident)
+            sql = "DELETE FROM cache"
+            if conditions:
+                sql += " WHERE " + " AND ".join(conditions)
+            db = self._cache_conn()
+            db.execute(sql, params)
+            db.commit()
+
+    def _cache_conn(self) -> sqlite3.Connection:
+        "Open (and create if needed) the on-disk cache database."
+
+        if self._cache_db is None:
+            path = _cache_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._cache_db = sqlite3.connect(path)
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "obj TEXT, ident TEXT, expires_at REAL, data BLOB, "
+                "PRIMARY KEY (obj, ident))"
+            )
+        return self._cache_db
+
+    def _cache_fernet(self):
+        """Fernet encryptor keyed off the session key, so cache entries are
+        useless without it and a new login invalidates old entries."""
+
+        if self._fernet is None:
+            digest = hashlib.sha256(str(self.key).encode("utf8")).digest()
+            self._fernet = Fernet(base64.urlsafe_b64encode(digest))
+        return self._fernet
+
+    def _disk_cache_get(self, obj: str, ident: str) -> Optional[bytes]:
+        "Fetch a still-fresh raw reply from the on-disk cache, if any."
+
+        db = self._cache_conn()
+        row = db.execute(
+            "SELECT expires_at, data FROM cache WHERE obj = ? AND ident = ?",
+            (obj, ident),
+        ).fetchone()
+        if row is None:
+            return None
+        expires_at, data = row
+        if expires_at < time.time():
+            db.execute(
+                "DELETE FROM cache WHERE obj = ? AND ident = ?", (obj, ident)
+            )
+            db.commit()
+            return None
+        try:
+            return self._cache_fernet().decrypt(data)
+        except InvalidToken:  # cached under a previous session key
+            return None
+
+    def _disk_cache_put(self, obj: str, ident: str, raw: bytes):
+        "Store a raw reply in the on-disk cache with the configured TTL."
+
+        db = self._cache_conn()
+        db.execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+            (obj, ident, time.time() + self.cache_ttl, self._cache_fernet().encrypt(raw)),
+        )
+        db.commit()
 
     def _call(self, args):
         "Helper method for adding session key and making Bitwarden CLI call."
 
+        if self._conn is not None:
+            return self._rest_call(args)
         args = [self.executable] + args
-        args.extend(["--session", self.key])
         bw = subprocess.Popen(
             args,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            env={**os.environ, "BW_SESSION": str(self.key)},
+            env=self._child_env,
         )
-        try:
-            reply, err = bw.communicate(timeout=self.timeout)
-        except subprocess.TimeoutExpired:
-            bw.kill()
-            raise
+        reply, err = _communicate(bw, timeout=self.timeout)
         if bw.returncode != 0:
             err = err.decode("utf8", "ignore")
             raise BitwardenError(f'Command: "{args}"\nStdErr: "{err}"')
         return reply
 
-    @_logged_in
+    def _rest_call(self, args):
+        """Translate a CLI-style `args` list into a `bw serve` REST route and
+        return the reply body as the CLI would have printed it."""
+
+        if args[0] == "get":
+            route = f"/object/{args[1]}/{urllib.parse.quote(args[2])}"
+        elif args[0] == "list":
+            # walk the flags one by one: boolean flags like --trash carry no
+            # value and map to `flag=true` query parameters
+            params = {}
+            flags = args[2:]
+            i = 0
+            while i < len(flags):
+                key = flags[i].lstrip("-")
+                if i + 1 < len(flags) and not flags[i + 1].startswith("--"):
+                    params[key] = flags[i + 1]
+                    i += 2
+                else:
+                    params[key] = "true"
+                    i += 1
+            route = f"/list/object/{args[1]}"
+            if params:
+                route += "?" + urllib.parse.urlencode(params)
+        else:
+            raise BitwardenError(f'Cannot route command "{args}" to `bw serve`.')
+
+        try:
+            self._conn.request("GET", route)
+            body = self._conn.getresponse().read()
+        except OSError as e:
+            raise BitwardenError(f"Could not reach `bw serve` backend: {e}") from e
+
+        reply = _loads(body)
+        if not reply.get("success"):
+            raise BitwardenError(
+                f'Route: "{route}"\nReply: "{body.decode("utf8", "ignore")}"'
+            )
+        data = reply["data"]
+        if isinstance(data, dict) and data.get("object") == "string":
+            return data["data"].encode("utf8")
+        if isinstance(data, dict) and data.get("object") == "list":
+            return json.dumps(data["data"]).encode("utf8")
+        return json.dumps(data).encode("utf8")
+
     def get(self, obj: BWObject, ident: str) -> Union[Dict[str, Any], str]:
         """Bitwarden `get` call. Supply CLI with the passed arguments and
-        decode any json replies"""
+        decode any json replies. Replies are cached per (obj, ident) until
+        `invalidate()` or `logout()`."""
 
-        args = f"get {obj} {ident}".split()
-        reply = self._call(args)
-        reply = reply.decode("utf8")
         try:
-            reply = json.loads(reply)
-        except json.decoder.JSONDecodeError:
+            return self._get_cache[obj, ident]
+        except KeyError:
             pass
+        raw = self._disk_cache_get(obj, ident) if self.cache_ttl else None
+        if raw is None:
+            raw = self._call(["get", obj, ident])
+            if self.cache_ttl:
+                self._disk_cache_put(obj, ident, raw)
+        reply = self._parse_get(obj, raw)
+        self._get_cache[obj, ident] = reply
         return reply
 
-    @_logged_in
+    @staticmethod
+    def _parse_get(obj: BWObject, reply: bytes) -> Union[Dict[str, Any], str]:
+        """Decode a raw `get` reply. Only object types known to return json
+        are parsed; everything else is returned as a plain string."""
+
+        if obj in _JSON_OBJS:
+            return _loads(reply)  # takes bytes, skipping a utf8 round-trip
+        return reply.decode("utf8").rstrip("\n")
+
     def get_item(self, ident: str) -> dict[str, Any]:
         "Convieninece method for `get`ing items. Equivalent to s.get('item', ident)."
         reply = self.get("item", ident)
         assert isinstance(reply, dict)
         return reply
 
-    @_logged_in
     def get_template(self, ident: BWTemplates) -> dict[str, Any]:
         "Convieninece metod for `get`ing templates for editing/creation."
 
@@ -204,7 +598,20 @@ class Session:
         assert isinstance(reply, dict)
         return reply
 
-    @_logged_in
+    def get_items(self, idents: Iterable[str]) -> list[dict[str, Any]]:
+        """Fetch several items by id with a single `list` call.
+
+        Issues one `bw list items` call and indexes the reply locally
+        instead of forking the CLI once per item, so for more than a few
+        items this is strictly faster than repeated `get_item` calls.
+        Items are returned in the requested order."""
+
+        by_id = {item["id"]: item for item in self.list("items")}
+        try:
+            return [by_id[ident] for ident in idents]
+        except KeyError as e:
+            raise BitwardenError(f"No item with id {e.args[0]!r}.") from e
+
     def list(
         self,
         obj: Literal[
@@ -222,6 +629,71 @@ class Session:
     ) -> list[dict[str, Any]]:
         "Make BitwardenCLI `list` call. Accepts CLI flags as key-word arguments."
 
+        args = self._list_args(obj, search, trash, kwargs)
+        reply = _loads(self._call(args))
+        assert isinstance(reply, list)
+        return reply
+
+    def iter_list(
+        self,
+        obj: Literal[
+            "items",
+            "folders",
+            "collections",
+            "organization",
+            "org-collections",
+            "org-members",
+        ],
+        search: Optional[str] = None,
+        *,
+        trash: bool = False,
+        **kwargs,
+    ) -> Iterable[dict[str, Any]]:
+        """Like `list`, but yields objects one at a time.
+
+        With `ijson` installed the CLI's stdout is parsed as it streams in,
+        so peak memory is bounded by a single object rather than the whole
+        vault and consumers can stop early. Without `ijson` (or over the
+        `bw serve` backend) this falls back to a buffered `list` call."""
+
+        if ijson is None or self._conn is not None:
+            yield from self.list(obj, search, trash=trash, **kwargs)
+            return
+
+        args = [self.executable] + self._list_args(obj, search, trash, kwargs)
+        bw = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self._child_env,
+        )
+        # a failed CLI emits no json, so ijson raises before the exit code
+        # can be checked; hold its error until the returncode says whether
+        # this was a CLI failure or genuinely bad output
+        parse_err = None
+        try:
+            yield from ijson.items(bw.stdout, "item")
+        except Exception as e:
+            parse_err = e
+        finally:
+            bw.stdout.close()
+            err = bw.stderr.read()
+            bw.stderr.close()
+            if bw.poll() is None:
+                bw.kill()
+            bw.wait()
+        if bw.returncode != 0:
+            err = err.decode("utf8", "ignore")
+            raise BitwardenError(
+                f'Command: "{args}"\nStdErr: "{err}"'
+            ) from parse_err
+        if parse_err is not None:
+            raise parse_err
+
+    @staticmethod
+    def _list_args(obj, search, trash, kwargs) -> list:
+        "Build the CLI argument list for a `list` call."
+
         kwargs["search"] = search
         kwargs["trash"] = trash
 
@@ -229,11 +701,12 @@ class Session:
         for key, value in kwargs.items():
             if not value:
                 continue
-            flags.extend([f"--{key}", value])
-        args = f"list {obj}".split() + flags
-        reply = json.loads(self._call(args))
-        assert isinstance(reply, list)
-        return reply
+            flag = _LIST_FLAG_NAMES.get(key) or f"--{key}"
+            if value is True:  # boolean flags like --trash take no argument
+                flags.append(flag)
+            else:
+                flags.extend((flag, value))
+        return ["list", obj, *flags]
 
     def __enter__(self):
         self.login()
@@ -241,3 +714,178 @@ class Session:
 
     def __exit__(self, type, value, traceback):
         self.logout()
+
+
+class AsyncSession(Session):
+    """`Session` variant for asyncio code. CLI calls run through
+    `asyncio.create_subprocess_exec` so one event loop can service many
+    concurrent vault calls instead of blocking a thread per call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        if self.serve:
+            raise BitwardenError(
+                "AsyncSession does not support the `bw serve` backend."
+            )
+
+    async def login(self, passwd: Optional[str] = None) -> str:
+        """Log into bitwarden and save the session key for use.
+        If no password has been supplied, prompt user with Pinentry"""
+
+        passwd = self._obtain_passwd(passwd)
+
+        try:
+            bw = await asyncio.create_subprocess_exec(
+                self.executable,
+                "login",
+                self.username,
+                "--raw",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            raise BitwardenError(
+                f"Bitwarden CLI `{self.executable}` could not be found."
+            ) from e
+
+        session_key, err = await asyncio.wait_for(
+            bw.communicate(bytes(passwd)), self.timeout
+        )
+        _zero(passwd)
+        del passwd  # Don't let sensitive info hang around
+        return self._finish_login(session_key, err, bw.returncode)
+
+    async def logout(self):
+        "Logout of BitWarden session and delete the session key"
+
+        bw = await asyncio.create_subprocess_exec(
+            self.executable,
+            "logout",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._child_env,
+        )
+        _, err = await asyncio.wait_for(bw.communicate(), self.timeout)
+        self._finish_logout(err, bw.returncode)
+
+    async def _call(self, args):
+        "Helper method for adding session key and making Bitwarden CLI call."
+
+        bw = await asyncio.create_subprocess_exec(
+            self.executable,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._child_env,
+        )
+        try:
+            reply, err = await asyncio.wait_for(bw.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            bw.kill()
+            await bw.wait()
+            raise
+        if bw.returncode != 0:
+            err = err.decode("utf8", "ignore")
+            raise BitwardenError(f'Command: "{args}"\nStdErr: "{err}"')
+        return reply
+
+    async def get(self, obj: BWObject, ident: str) -> Union[Dict[str, Any], str]:
+        """Bitwarden `get` call. Supply CLI with the passed arguments and
+        decode any json replies. Replies are cached per (obj, ident) until
+        `invalidate()` or `logout()`, and concurrent calls for the same
+        (obj, ident) share a single CLI invocation."""
+
+        try:
+            return self._get_cache[obj, ident]
+        except KeyError:
+            pass
+        inflight = self._inflight.get((obj, ident))
+        if inflight is not None:  # someone is already fetching this key
+            return await inflight
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[obj, ident] = fut
+        try:
+            raw = self._disk_cache_get(obj, ident) if self.cache_ttl else None
+            if raw is None:
+                raw = await self._call(["get", obj, ident])
+                if self.cache_ttl:
+                    self._disk_cache_put(obj, ident, raw)
+            reply = self._parse_get(obj, raw)
+            self._get_cache[obj, ident] = reply
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved in case no one was waiting
+            raise
+        finally:
+            del self._inflight[obj, ident]
+        fut.set_result(reply)
+        return reply
+
+    async def get_item(self, ident: str) -> dict[str, Any]:
+        "Convieninece method for `get`ing items. Equivalent to s.get('item', ident)."
+        reply = await self.get("item", ident)
+        assert isinstance(reply, dict)
+        return reply
+
+    async def get_template(self, ident: BWTemplates) -> dict[str, Any]:
+        "Convieninece metod for `get`ing templates for editing/creation."
+
+        reply = await self.get("template", ident)
+        assert isinstance(reply, dict)
+        return reply
+
+    async def get_items(self, idents: Iterable[str]) -> list[dict[str, Any]]:
+        """Fetch several items by id with a single `list` call.
+        See `Session.get_items`."""
+
+        by_id = {item["id"]: item for item in await self.list("items")}
+        try:
+            return [by_id[ident] for ident in idents]
+        except KeyError as e:
+            raise BitwardenError(f"No item with id {e.args[0]!r}.") from e
+
+    async def list(
+        self,
+        obj: Literal[
+            "items",
+            "folders",
+            "collections",
+            "organization",
+            "org-collections",
+            "org-members",
+        ],
+        search: Optional[str] = None,
+        *,
+        trash: bool = False,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        "Make BitwardenCLI `list` call. Accepts CLI flags as key-word arguments."
+
+        args = self._list_args(obj, search, trash, kwargs)
+        reply = _loads(await self._call(args))
+        assert isinstance(reply, list)
+        return reply
+
+    def iter_list(self, *args, **kwargs):
+        """Streaming `iter_list` reads a blocking pipe and would stall the
+        event loop; there is no async variant. Use `list` instead."""
+
+        raise BitwardenError(
+            "AsyncSession does not support iter_list; use list() instead."
+        )
+
+    def __enter__(self):
+        # the inherited sync protocol would silently leave login() unawaited
+        raise TypeError("use 'async with' for AsyncSession")
+
+    def __exit__(self, type, value, traceback):
+        raise TypeError("use 'async with' for AsyncSession")
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.logout()
@@ -30,5 +30,10 @@ setup(
     install_requires=[
         "pynentry >= 0.1.4",
     ],
+    extras_require={
+        "cache": ["cryptography"],  # encrypted on-disk cache (cache_ttl=...)
+        "speed": ["orjson"],  # faster json parsing of CLI replies
+        "stream": ["ijson"],  # streaming iter_list
+    },
     py_modules=["bw_bindings"],
 )
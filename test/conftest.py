@@ -1,9 +1,215 @@
+import json
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
 import bw_bindings as bw
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+@lru_cache(maxsize=None)
+def load_vault():
+    "Parse sample_data.json exactly once per test session."
+    return _loads((Path(__file__).parent / "sample_data.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def vault():
+    return load_vault()
+
+
+# the emulator's replies are deterministic, so build each table once on
+# first use; targeted runs (e.g. `pytest test/test_login.py`) never pay
+@lru_cache(maxsize=None)
+def all_pass_bytes():
+    return {
+        obj["name"]: obj["login"]["password"].encode("utf8")
+        for obj in load_vault()["items"]
+    }
+
+
+@lru_cache(maxsize=None)
+def items_by_name():
+    name_counts = Counter(item["name"] for item in load_vault()["items"])
+    # only uniquely-named items resolve; duplicates (the two amazon.com
+    # entries) must keep failing like the real CLI's ambiguous-search error
+    return {
+        item["name"]: item
+        for item in load_vault()["items"]
+        if name_counts[item["name"]] == 1
+    }
+
+
+@lru_cache(maxsize=None)
+def item_json_bytes():
+    return {
+        name: json.dumps(item).encode("utf8")
+        for name, item in items_by_name().items()
+    }
+
+
+@lru_cache(maxsize=None)
+def list_json_bytes():
+    return json.dumps(load_vault()["items"][:2]).encode("utf8")
+
+
+TEMPLATE_BYTES = (
+    b'{"organizationId":null,"collectionIds":null,"folderId":null,'
+    b'"type":1,"name":"Item name","notes":"Some notes about this item.",'
+    b'"favorite":false,"fields":[],"login":null,"secureNote":null,'
+    b'"card":null,"identity":null,"reprompt":0}'
+)
+
+
+def bw_emulator(command, *, env=None, mock_obj=None):
+    "Answer a mocked `communicate` call the way the real CLI would."
+    assert command[0] == "bw"
+    args = command[1:]
+    if args[0] == "get":
+        assert env["BW_SESSION"] == "session_key"
+        obj, key = args[1:3]
+        if obj == "password":
+            try:
+                return all_pass_bytes()[key], b""
+            except KeyError:
+                pass
+        if obj == "item":
+            try:
+                return item_json_bytes()[key], b""
+            except KeyError:
+                pass
+        if obj == "template":
+            return TEMPLATE_BYTES, b""
+    if args[0] == "login":
+        return b"session_key", b""
+
+    if args[0] == "logout":
+        return b"", b""
+
+    if args[0] == "list":
+        return list_json_bytes(), b""
+
+    if mock_obj is not None:
+        mock_obj.return_value.returncode = 1
+    return b"", b"error"
+
+
+@pytest.fixture
+def bw_responder():
+    """Callable driving the mocked `communicate`; modules that want vault
+    behavior override this to return `bw_emulator`."""
+    return None
+
+
+@pytest.fixture
+def mock_bw(monkeypatch, bw_responder):
+    # no test asserts Popen's signature, so skip spec= introspection entirely
+    m_popen = mock.Mock()
+    m_popen.return_value.returncode = 0
+    if bw_responder is None:
+        m_popen.return_value.communicate.return_value = (b"session_key", b"")
+    else:
+        # capture argv/env when Popen is called so the responder never has
+        # to rebuild Mock.call_args on every communicate
+        last_call = {}
+
+        def capture_popen(*args, **kwargs):
+            last_call["argv"] = args[0]
+            last_call["env"] = kwargs.get("env")
+            return mock.DEFAULT
+
+        m_popen.side_effect = capture_popen
+
+        def responder_wrapper(*_, **__):
+            return bw_responder(
+                last_call["argv"], env=last_call["env"], mock_obj=m_popen
+            )
+
+        m_popen.return_value.communicate.side_effect = responder_wrapper
+    monkeypatch.setattr(bw.subprocess, "Popen", m_popen)
+    return m_popen
+
+
+class FakeProcess:
+    "Stand-in for Popen: canned stdout/stderr without Mock's introspection cost."
+
+    __slots__ = ("returncode", "_out", "_err")
+
+    def __init__(self, out=b"", err=b"", returncode=0):
+        self.returncode = returncode
+        self._out = out
+        self._err = err
+
+    def communicate(self, input=None, timeout=None):
+        return self._out, self._err
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def kill(self):
+        pass
+
+
+class FakePopenFactory:
+    "Callable Popen replacement that records calls and returns one FakeProcess."
+
+    def __init__(self, proc=None):
+        self.calls = []
+        self.proc = proc if proc is not None else FakeProcess(b"session_key", b"")
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.proc
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+
+@pytest.fixture
+def fake_popen(monkeypatch):
+    """Patch `bw.subprocess.Popen` with a plain recording factory, for tests
+    that only need canned output and no Mock conveniences."""
+    factory = FakePopenFactory()
+    monkeypatch.setattr(bw.subprocess, "Popen", factory)
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def fake_bw_executable(monkeypatch):
+    """Resolve the CLI to a bare "bw" without consulting $PATH, so the suite
+    runs on machines with no bitwarden install (and never picks up a real
+    one). `_find_bw` is lru_cache'd, so patch the function, not shutil.which."""
+
+    monkeypatch.setattr(bw, "_find_bw", lambda: "bw")
+
+
+@pytest.fixture(autouse=True)
+def no_real_subprocess(request, monkeypatch):
+    """Fail loudly if a test spawns a real process without mocking Popen.
+
+    Tests that opt into `mock_bw` or `fake_popen` patch the binding
+    themselves; everything else gets a raiser so an accidental fork/exec
+    shows up as an error instead of a slow (or destructive) real `bw` call.
+    """
+    if {"mock_bw", "fake_popen"} & set(request.fixturenames):
+        return
+
+    def raise_on_popen(*args, **kwargs):
+        raise AssertionError(f"test tried to spawn a real process: {args!r}")
+
+    monkeypatch.setattr(bw.subprocess, "Popen", raise_on_popen)
+
 
 @pytest.fixture(autouse=True)
 def mock_pynentry(monkeypatch):
@@ -0,0 +1,92 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+import bw_bindings as bw
+
+
+@pytest.fixture(autouse=True)
+def mock_async_bw(monkeypatch):
+    m_exec = mock.Mock()
+    m_exec.return_value.communicate.return_value = (b"session_key", b"")
+    m_exec.return_value.returncode = 0
+
+    async def fake_exec(*args, **kwargs):
+        proc = m_exec(*args, **kwargs)
+
+        async def communicate(input=None):
+            return proc.communicate.return_value
+
+        fake_proc = mock.Mock()
+        fake_proc.communicate = communicate
+        fake_proc.returncode = proc.returncode
+        return fake_proc
+
+    monkeypatch.setattr(bw.asyncio, "create_subprocess_exec", fake_exec)
+    return m_exec
+
+
+def test_async_login(mock_async_bw):
+    session = bw.AsyncSession("username")
+    asyncio.run(session.login("passwd"))
+
+    assert "username" in mock_async_bw.call_args.args
+    assert session.key == "session_key"
+
+
+def test_async_get(mock_async_bw):
+    session = bw.AsyncSession("user")
+
+    async def run():
+        await session.login("passwd")
+        mock_async_bw.return_value.communicate.return_value = (b"hunter2", b"")
+        return await session.get("password", "xbox.com")
+
+    assert asyncio.run(run()) == "hunter2"
+
+
+def test_async_get_coalesced(mock_async_bw):
+    session = bw.AsyncSession("user")
+
+    async def run():
+        await session.login("passwd")
+        mock_async_bw.return_value.communicate.return_value = (b"hunter2", b"")
+        return await asyncio.gather(
+            session.get("password", "xbox.com"),
+            session.get("password", "xbox.com"),
+        )
+
+    assert asyncio.run(run()) == ["hunter2", "hunter2"]
+    assert mock_async_bw.call_count == 2  # login + a single shared get
+
+
+def test_async_iter_list_unsupported(mock_async_bw):
+    session = bw.AsyncSession("user")
+    asyncio.run(session.login("passwd"))
+    with pytest.raises(bw.BitwardenError):
+        session.iter_list("items")
+
+
+def test_async_get_err_with_no_login():
+    session = bw.AsyncSession("username")
+    with pytest.raises(bw.BitwardenNotLoggedInError):
+        session.get("password", "xbox.com")
+
+
+def test_async_session_rejects_sync_with():
+    with pytest.raises(TypeError):
+        with bw.AsyncSession("user", "pass"):
+            pass
+
+
+def test_async_session_context(mock_async_bw):
+    async def run():
+        async with bw.AsyncSession("user", "pass") as session:
+            assert session.key == "session_key"
+
+    asyncio.run(run())
+    assert mock_async_bw.call_count == 2
+    calls_args = [call.args for call in mock_async_bw.call_args_list]
+    assert "login" in calls_args[0]
+    assert "logout" in calls_args[1]
@@ -1,82 +1,23 @@
-from unittest import mock
-import json
-from pathlib import Path
-
 import pytest
 
-import bw_bindings as bw
-
-p = Path(__file__).parent.resolve()
-with open(p / "sample_data.json") as fin:
-    VAULT = json.load(fin)
-
-ALL_PASS = {obj["name"]: obj["login"]["password"] for obj in VAULT["items"]}
+import io
 
+import bw_bindings as bw
+from conftest import FakeProcess, bw_emulator, list_json_bytes
 
-@pytest.fixture(autouse=True)
-def mock_bw(monkeypatch):
-
-    m_popen = mock.Mock(spec=bw.subprocess.Popen)
-    m_popen.return_value.returncode = 0
-
-    def bw_emu_wrapper(*args, **_):
-        return bw_emulator(*args, mock_obj=m_popen)
 
-    m_popen.return_value.communicate.side_effect = bw_emu_wrapper
-    monkeypatch.setattr(bw.subprocess, "Popen", m_popen)
-    return m_popen
+@pytest.fixture
+def bw_responder():
+    "Drive this module's mocked CLI with the full vault emulator."
+    return bw_emulator
 
 
-@pytest.fixture
-def mock_comm(mock_bw):
-    return mock_bw.return_value.communicate
-
-
-def bw_emulator(*args, mock_obj=None, **_):
-    if mock_obj is None:
-        return b"", b""
-    command = mock_obj.call_args.args[0]
-    assert command[0] == "bw"
-    args = command[1:]
-    if args[0] == "get":
-        assert "session_key" in command
-        obj, key = args[1:3]
-        if obj == "password":
-            try:
-                return ALL_PASS[key].encode("utf8"), b""
-            except KeyError:
-                pass
-        if obj == "item":
-            canidates = [item for item in VAULT["items"] if item["name"] == key]
-            if len(canidates) == 1:
-                return json.dumps(canidates[0]).encode("utf8"), b""
-        if obj == "template":
-            return (
-                (
-                    b'{"organizationId":null,"collectionIds":null,"folderId":null,'
-                    b'"type":1,"name":"Item name","notes":"Some notes about this item.",'
-                    b'"favorite":false,"fields":[],"login":null,"secureNote":null,'
-                    b'"card":null,"identity":null,"reprompt":0}'
-                ),
-                b"",
-            )
-    if args[0] == "login":
-        return b"session_key", b""
-
-    if args[0] == "list":
-        return json.dumps(VAULT["items"][:2]).encode("utf8"), b""
-
-    mock_obj.return_value.returncode = 1
-    return b"", b"error"
-
-
-def test_get(mock_comm):
-    mock_comm.return_value = (
-        VAULT["items"][-2]["login"]["password"].encode("utf8"),
-        b"",
-    )
+def test_get(fake_popen, vault):
     session = bw.Session("user@email.com")
     session.login()
+    fake_popen.proc = FakeProcess(
+        vault["items"][-2]["login"]["password"].encode("utf8"), b""
+    )
     assert session.get("password", "xbox.com") == "aijee9Ee"
 
 
@@ -86,7 +27,7 @@ def test_get_err_with_no_login():
         session.get("password", "xbox.com")
 
 
-def test_get_not_found():
+def test_get_not_found(mock_bw):
     session = bw.Session("user")
     session.login()
     with pytest.raises(bw.BitwardenError):
@@ -94,7 +35,7 @@ def test_get_not_found():
         session.get("password", "github")
 
 
-def test_get_item():
+def test_get_item(mock_bw):
     session = bw.Session("user")
     session.login()
     item = session.get_item("xbox.com")
@@ -102,7 +43,7 @@ def test_get_item():
     assert item["login"]["username"] == "user@email.com"
 
 
-def test_get_json_item():
+def test_get_json_item(mock_bw):
     session = bw.Session("user")
     session.login()
     template = session.get("template", "item")
@@ -110,7 +51,7 @@ def test_get_json_item():
     assert template["name"] == "Item name"
 
 
-def test_get_template():
+def test_get_template(mock_bw):
     session = bw.Session("user")
     session.login()
     template = session.get_template("item")
@@ -118,7 +59,54 @@ def test_get_template():
     assert template["name"] == "Item name"
 
 
-def test_list():
+def test_get_cached(mock_bw):
+    session = bw.Session("user")
+    session.login()
+    session.get_item("xbox.com")
+    calls = mock_bw.call_count
+    session.get_item("xbox.com")
+    assert mock_bw.call_count == calls
+    session.invalidate("item", "xbox.com")
+    session.get_item("xbox.com")
+    assert mock_bw.call_count == calls + 1
+
+
+def test_disk_cache(mock_bw, tmp_path, monkeypatch):
+    pytest.importorskip("cryptography")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    session = bw.Session("user", cache_ttl=60)
+    session.login()
+    session.get_item("xbox.com")
+
+    # a fresh session with the same key should be served from disk
+    session = bw.Session("user", cache_ttl=60)
+    session.login()
+    calls = mock_bw.call_count
+    assert session.get_item("xbox.com")["name"] == "xbox.com"
+    assert mock_bw.call_count == calls
+
+    session.invalidate()
+    session.get_item("xbox.com")
+    assert mock_bw.call_count == calls + 1
+
+
+def test_get_items(mock_bw, vault):
+    session = bw.Session("user")
+    session.login()
+    wanted = [item["id"] for item in reversed(vault["items"][:2])]
+    items = session.get_items(wanted)
+    assert [item["id"] for item in items] == wanted
+
+
+def test_get_items_missing(mock_bw):
+    session = bw.Session("user")
+    session.login()
+    with pytest.raises(bw.BitwardenError):
+        session.get_items(["no-such-id"])
+
+
+def test_list(mock_bw):
     session = bw.Session("user")
     session.login()
     items = session.list("items")
@@ -134,9 +122,50 @@ def test_list_kwargs(mock_bw):
     _ = session.list("items")
     assert "--search" not in mock_bw.call_args.args[0]
     session.list("items", "amazon", folderid="1234")
-    assert "--folderid" in mock_bw.call_args.args[0]
-    idx = mock_bw.call_args.args[0].index("--folderid")
-    assert mock_bw.call_args.args[0][idx + 1] == "1234"
+    cmd = mock_bw.call_args.args[0]
+    assert "--folderid" in cmd
+    assert cmd[cmd.index("--folderid") + 1] == "1234"
+
+
+def test_iter_list(mock_bw, monkeypatch):
+    # force the buffered fallback even where the optional ijson is installed
+    monkeypatch.setattr(bw, "ijson", None)
+    session = bw.Session("user")
+    session.login()
+    items = list(session.iter_list("items"))
+    assert items[0]["name"] == "amazon.com"
+
+
+def test_iter_list_streaming(mock_bw):
+    pytest.importorskip("ijson")
+    session = bw.Session("user")
+    session.login()
+    mock_bw.return_value.stdout = io.BytesIO(list_json_bytes())
+    mock_bw.return_value.stderr = io.BytesIO(b"")
+    items = list(session.iter_list("items"))
+    assert items[0]["name"] == "amazon.com"
+
+
+def test_iter_list_cli_failure(mock_bw):
+    pytest.importorskip("ijson")
+    session = bw.Session("user")
+    session.login()
+    # a failing CLI leaves stdout empty; the caller should still see a
+    # BitwardenError carrying stderr, not a raw parse error
+    mock_bw.return_value.stdout = io.BytesIO(b"")
+    mock_bw.return_value.stderr = io.BytesIO(b"error")
+    mock_bw.return_value.returncode = 1
+    with pytest.raises(bw.BitwardenError):
+        list(session.iter_list("items"))
+
+
+def test_list_trash_flag(mock_bw):
+    session = bw.Session("user")
+    session.login()
+    session.list("items", trash=True)
+    cmd = mock_bw.call_args.args[0]
+    assert "--trash" in cmd
+    assert True not in cmd
 
 
 def test_list_logged_in():
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+import bw_bindings as bw
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+class FakeHTTPConnection:
+    "Stand-in for http.client.HTTPConnection answering `bw serve` routes."
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.requests = []
+        self.closed = False
+        FakeHTTPConnection.instances.append(self)
+
+    def request(self, method, route):
+        self.requests.append((method, route))
+
+    def getresponse(self):
+        method, route = self.requests[-1]
+        return FakeResponse(self._reply(route))
+
+    def close(self):
+        self.closed = True
+
+    @staticmethod
+    def _reply(route):
+        if route in ("/status", "/lock"):
+            return json.dumps({"success": True, "data": {}}).encode("utf8")
+        if route.startswith("/object/password/"):
+            return json.dumps(
+                {"success": True, "data": {"object": "string", "data": "hunter2"}}
+            ).encode("utf8")
+        if route.startswith("/list/object/"):
+            return json.dumps(
+                {"success": True, "data": {"object": "list", "data": []}}
+            ).encode("utf8")
+        return json.dumps({"success": False}).encode("utf8")
+
+
+@pytest.fixture
+def fake_serve(monkeypatch, mock_bw):
+    FakeHTTPConnection.instances = []
+    monkeypatch.setattr(bw.http.client, "HTTPConnection", FakeHTTPConnection)
+    monkeypatch.setattr(bw, "_daemons", {})
+    return FakeHTTPConnection
+
+
+def all_requests(fake_serve):
+    return [req for conn in fake_serve.instances for req in conn.requests]
+
+
+def test_serve_get_routing(fake_serve):
+    session = bw.Session("user", serve=True)
+    session.login()
+    assert session.get("password", "xbox.com") == "hunter2"
+    assert ("GET", "/object/password/xbox.com") in all_requests(fake_serve)
+
+
+def test_serve_list_routing(fake_serve):
+    session = bw.Session("user", serve=True)
+    session.login()
+    assert session.list("items", "amazon", folderid="1234") == []
+    route = fake_serve.instances[-1].requests[-1][1]
+    assert route.startswith("/list/object/items?")
+    assert "search=amazon" in route
+    assert "folderid=1234" in route
+
+
+def test_serve_list_trash_flag(fake_serve):
+    session = bw.Session("user", serve=True)
+    session.login()
+    session.list("items", trash=True)
+    route = fake_serve.instances[-1].requests[-1][1]
+    assert "trash=true" in route
+
+
+def test_serve_refcount(fake_serve, mock_bw):
+    first = bw.Session("user", serve=True)
+    first.login()
+    second = bw.Session("user", serve=True)
+    second.login()
+    # both sessions share one refcounted daemon
+    assert len(bw._daemons) == 1
+    assert bw._daemons["user"][2] == 2
+    daemon = bw._daemons["user"][0]
+
+    first.logout()
+    assert "user" in bw._daemons
+    assert not daemon.terminate.called
+    assert ("POST", "/lock") not in all_requests(fake_serve)
+
+    # last one out locks the vault and tears the daemon down
+    second.logout()
+    assert "user" not in bw._daemons
+    assert daemon.terminate.called
+    assert ("POST", "/lock") in all_requests(fake_serve)